@@ -9,14 +9,16 @@ Visit <https://github.com/jwodder/linesep> or <https://linesep.rtfd.io> for
 more information.
 """
 
-__version__ = "0.5.1"
+__version__ = "0.6.0.dev1"
 __author__ = "John Thorvald Wodder II"
 __author_email__ = "linesep@varonathe.org"
 __license__ = "MIT"
 __url__ = "https://github.com/jwodder/linesep"
 
 from .funcs import (
+    DEFAULT_CHUNK_SIZE,
     ascii_splitlines,
+    iter_separated_offsets,
     join_preceded,
     join_separated,
     join_terminated,
@@ -47,6 +49,7 @@ from .splitters import (
 )
 
 __all__ = [
+    "DEFAULT_CHUNK_SIZE",
     "ParagraphSplitter",
     "PrecededSplitter",
     "SeparatedSplitter",
@@ -59,6 +62,7 @@ __all__ = [
     "UniversalNewlineSplitter",
     "ascii_splitlines",
     "get_newline_splitter",
+    "iter_separated_offsets",
     "join_preceded",
     "join_separated",
     "join_terminated",
@@ -1,15 +1,23 @@
 from __future__ import annotations
 from collections.abc import Iterable, Iterator
+from functools import lru_cache, partial
+import io
 import re
-from typing import AnyStr, IO
+from typing import AnyStr, IO, Literal, Optional
 from warnings import warn
 
+#: .. versionadded:: 0.6.0
+#:
+#: The default number of bytes or characters that the ``read_*`` functions
+#: read from a filehandle at a time
+DEFAULT_CHUNK_SIZE = 65536
+
 
 def read_preceded(
     fp: IO[AnyStr],
     sep: AnyStr | re.Pattern[AnyStr],
     retain: bool = False,
-    chunk_size: int = 512,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Iterator[AnyStr]:
     """
     Read segments from a file-like object ``fp`` in which the beginning of each
@@ -26,32 +34,29 @@ def read_preceded(
         Passing a regular expression as a separator is deprecated, and support
         will be removed in version 1.0.
 
+    .. versionchanged:: 0.6.0
+
+        The default ``chunk_size`` is now `DEFAULT_CHUNK_SIZE`; previously, it
+        was 512
+
     :param fp: a binary or text file-like object
     :param sep: a string or compiled regex that indicates the start of a new
         segment wherever it occurs
     :param bool retain: whether to include the separators at the beginning of
         each segment
     :param int chunk_size: how many bytes or characters to read from ``fp`` at
-        a time
+        a time; defaults to `DEFAULT_CHUNK_SIZE`
     :return: a generator of the segments in ``fp``
     :rtype: generator of binary or text strings
     """
-    # Omits empty leading entry
-    entries = read_separated(fp, sep, retain=retain, chunk_size=chunk_size)
-    e = next(entries)
-    if e:
-        yield e
-    if retain:
-        entries = _join_pairs(entries)
-    for e in entries:
-        yield e
+    return _read(fp, sep, "preceded", retain, chunk_size)
 
 
 def read_separated(
     fp: IO[AnyStr],
     sep: AnyStr | re.Pattern[AnyStr],
     retain: bool = False,
-    chunk_size: int = 512,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Iterator[AnyStr]:
     """
     Read segments from a file-like object ``fp`` in which segments are
@@ -68,6 +73,11 @@ def read_separated(
         Passing a regular expression as a separator is deprecated, and support
         will be removed in version 1.0.
 
+    .. versionchanged:: 0.6.0
+
+        The default ``chunk_size`` is now `DEFAULT_CHUNK_SIZE`; previously, it
+        was 512
+
     :param fp: a binary or text file-like object
     :param sep: a string or compiled regex that indicates the end of one
         segment and the beginning of another wherever it occurs
@@ -75,36 +85,18 @@ def read_separated(
         the output, with the elements of the generator alternating between
         segments and separators, starting with a (possibly empty) segment
     :param int chunk_size: how many bytes or characters to read from ``fp`` at
-        a time
+        a time; defaults to `DEFAULT_CHUNK_SIZE`
     :return: a generator of the segments in ``fp``
     :rtype: generator of binary or text strings
     """
-    if not isinstance(sep, (bytes, str)):
-        warn(
-            "Passing a regular expression separator to a read_*() function is"
-            " deprecated and will be removed in v1.0",
-            DeprecationWarning,
-        )
-    seppattern = _ensure_compiled(sep)
-    empty = fp.read(0)  # b'' or u'' as appropriate
-    buff = empty
-    for chunk in iter(lambda: fp.read(chunk_size), empty):
-        buff += chunk
-        lastend = 0
-        for m in seppattern.finditer(buff):
-            yield buff[lastend : m.start()]
-            if retain:
-                yield m.group()
-            lastend = m.end()
-        buff = buff[lastend:]
-    yield buff
+    return _read(fp, sep, "separated", retain, chunk_size)
 
 
 def read_terminated(
     fp: IO[AnyStr],
     sep: AnyStr | re.Pattern[AnyStr],
     retain: bool = False,
-    chunk_size: int = 512,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Iterator[AnyStr]:
     """
     Read segments from a file-like object ``fp`` in which the end of each
@@ -121,27 +113,22 @@ def read_terminated(
         Passing a regular expression as a separator is deprecated, and support
         will be removed in version 1.0.
 
+    .. versionchanged:: 0.6.0
+
+        The default ``chunk_size`` is now `DEFAULT_CHUNK_SIZE`; previously, it
+        was 512
+
     :param fp: a binary or text file-like object
     :param sep: a string or compiled regex that indicates the end of a segment
         wherever it occurs
     :param bool retain: whether to include the separators at the end of each
         segment
     :param int chunk_size: how many bytes or characters to read from ``fp`` at
-        a time
+        a time; defaults to `DEFAULT_CHUNK_SIZE`
     :return: a generator of the segments in ``fp``
     :rtype: generator of binary or text strings
     """
-    # Omits empty trailing entry
-    prev = None
-    entries = read_separated(fp, sep, retain=retain, chunk_size=chunk_size)
-    if retain:
-        entries = _join_pairs(entries)
-    for e in entries:
-        if prev is not None:
-            yield prev
-        prev = e
-    if prev:
-        yield prev
+    return _read(fp, sep, "terminated", retain, chunk_size)
 
 
 def split_preceded(
@@ -164,7 +151,7 @@ def split_preceded(
     """
     entries = split_separated(s, sep, retain)
     if retain:
-        entries[1:] = list(_join_pairs(entries[1:]))
+        entries[1:] = _join_pairs(entries[1:])
     if not entries[0]:
         entries.pop(0)
     return entries
@@ -189,16 +176,51 @@ def split_separated(
     :return: a list of the segments in ``s``
     :rtype: list of binary or text strings
     """
-    seppattern = _ensure_compiled(sep)
-    entries = []
+    if isinstance(sep, (bytes, str)) and sep:
+        # Literal separators can be split on directly without a regex
+        parts = s.split(sep)
+        return _interleave(parts, [sep] * (len(parts) - 1)) if retain else parts
+    pattern = _ensure_compiled(sep)
+    literal = _required_literal(pattern)
+    if literal is not None and literal not in s:
+        # The regex cannot match anywhere, so skip scanning with it
+        return [s]
+    segments, separators = _regex_split(s, pattern, retain)
+    return _interleave(segments, separators) if retain else segments
+
+
+def iter_separated_offsets(
+    s: AnyStr, sep: AnyStr | re.Pattern[AnyStr]
+) -> Iterator[tuple[int, int]]:
+    """
+    .. versionadded:: 0.6.0
+
+    Like `split_separated()`, but instead of returning the segments of ``s``
+    themselves, yield a ``(start, end)`` pair of indices for each segment such
+    that ``s[start:end]`` is the segment.  This lets callers that only need to
+    count, locate, or inspect segments avoid creating a new string for each
+    one.
+
+    :param s: a binary or text string
+    :param sep: a string or compiled regex that indicates the end of one
+        segment and the beginning of another wherever it occurs
+    :return: a generator of pairs of indices into ``s``
+    :rtype: generator of pairs of ints
+    """
     lastend = 0
-    for m in seppattern.finditer(s):
-        entries.append(s[lastend : m.start()])
-        if retain:
-            entries.append(m.group())
-        lastend = m.end()
-    entries.append(s[lastend:])
-    return entries
+    if isinstance(sep, (bytes, str)) and sep:
+        seplen = len(sep)
+        i = s.find(sep)
+        while i != -1:
+            yield (lastend, i)
+            lastend = i + seplen
+            i = s.find(sep, lastend)
+    else:
+        for m in _ensure_compiled(sep).finditer(s):
+            start, end = m.span()
+            yield (lastend, start)
+            lastend = end
+    yield (lastend, len(s))
 
 
 def split_terminated(
@@ -221,7 +243,7 @@ def split_terminated(
     """
     entries = split_separated(s, sep, retain)
     if retain:
-        entries = list(_join_pairs(entries))
+        entries = _join_pairs(entries)
     if not entries[-1]:
         entries.pop()
     return entries
@@ -235,7 +257,8 @@ def join_preceded(iterable: Iterable[AnyStr], sep: AnyStr) -> AnyStr:
     :param sep: a binary or text string
     :rtype: a binary or text string
     """
-    return sep[0:0].join(sep + s for s in iterable)
+    parts = list(iterable)
+    return sep + sep.join(parts) if parts else sep[0:0]
 
 
 def join_separated(iterable: Iterable[AnyStr], sep: AnyStr) -> AnyStr:
@@ -258,82 +281,389 @@ def join_terminated(iterable: Iterable[AnyStr], sep: AnyStr) -> AnyStr:
     :param sep: a binary or text string
     :rtype: a binary or text string
     """
-    return sep[0:0].join(s + sep for s in iterable)
+    parts = list(iterable)
+    return sep.join(parts) + sep if parts else sep[0:0]
 
 
-def write_preceded(fp: IO[AnyStr], iterable: Iterable[AnyStr], sep: AnyStr) -> None:
+def write_preceded(
+    fp: IO[AnyStr],
+    iterable: Iterable[AnyStr],
+    sep: AnyStr,
+    chunk_size: Optional[int] = None,
+) -> None:
     """
     Write the elements of ``iterable`` to the filehandle ``fp``, preceding each
     one with ``sep``
 
+    By default, each element is written to ``fp`` (together with its
+    separator) as soon as it is received.  If ``chunk_size`` is given, elements
+    are instead collected and written in batches of about that many characters
+    or bytes at a time, which makes fewer, larger writes.
+
+    .. versionchanged:: 0.6.0
+
+        ``chunk_size`` parameter added
+
     :param fp: a binary or text file-like object
     :param iterable: an iterable of binary or text strings
     :param sep: a binary or text string
+    :param chunk_size: approximately how many bytes or characters to write to
+        ``fp`` at a time; if `None` (the default), each element is written
+        individually
     :return: `None`
     """
-    for s in iterable:
-        fp.write(sep)
-        fp.write(s)
+    _write(fp, iterable, sep, "preceded", chunk_size)
 
 
-def write_separated(fp: IO[AnyStr], iterable: Iterable[AnyStr], sep: AnyStr) -> None:
+def write_separated(
+    fp: IO[AnyStr],
+    iterable: Iterable[AnyStr],
+    sep: AnyStr,
+    chunk_size: Optional[int] = None,
+) -> None:
     """
     Write the elements of ``iterable`` to the filehandle ``fp``, separating
     consecutive elements with ``sep``
 
+    By default, each element is written to ``fp`` (together with its
+    separator) as soon as it is received.  If ``chunk_size`` is given, elements
+    are instead collected and written in batches of about that many characters
+    or bytes at a time, which makes fewer, larger writes.
+
+    .. versionchanged:: 0.6.0
+
+        ``chunk_size`` parameter added
+
     :param fp: a binary or text file-like object
     :param iterable: an iterable of binary or text strings
     :param sep: a binary or text string
+    :param chunk_size: approximately how many bytes or characters to write to
+        ``fp`` at a time; if `None` (the default), each element is written
+        individually
     :return: `None`
     """
-    first = True
-    for s in iterable:
-        if first:
-            first = False
-        else:
-            fp.write(sep)
-        fp.write(s)
+    _write(fp, iterable, sep, "separated", chunk_size)
 
 
-def write_terminated(fp: IO[AnyStr], iterable: Iterable[AnyStr], sep: AnyStr) -> None:
+def write_terminated(
+    fp: IO[AnyStr],
+    iterable: Iterable[AnyStr],
+    sep: AnyStr,
+    chunk_size: Optional[int] = None,
+) -> None:
     """
     Write the elements of ``iterable`` to the filehandle ``fp``, appending
     ``sep`` to each one
 
+    By default, each element is written to ``fp`` (together with its
+    separator) as soon as it is received.  If ``chunk_size`` is given, elements
+    are instead collected and written in batches of about that many characters
+    or bytes at a time, which makes fewer, larger writes.
+
+    .. versionchanged:: 0.6.0
+
+        ``chunk_size`` parameter added
+
     :param fp: a binary or text file-like object
     :param iterable: an iterable of binary or text strings
     :param sep: a binary or text string
+    :param chunk_size: approximately how many bytes or characters to write to
+        ``fp`` at a time; if `None` (the default), each element is written
+        individually
     :return: `None`
     """
+    _write(fp, iterable, sep, "terminated", chunk_size)
+
+
+def _write(
+    fp: IO[AnyStr],
+    iterable: Iterable[AnyStr],
+    sep: AnyStr,
+    mode: Literal["preceded", "separated", "terminated"],
+    chunk_size: Optional[int],
+) -> None:
+    """
+    Implementation of the ``write_*`` functions.  If ``chunk_size`` is `None`,
+    each element is written along with its separator in a single
+    ``fp.write()`` call.  Otherwise, elements are collected into batches of at
+    least ``chunk_size`` characters or bytes (counting separators), and each
+    batch is joined and passed to a single ``fp.write()`` call.
+    """
+    if chunk_size is None:
+        if mode == "preceded":
+            for s in iterable:
+                fp.write(sep + s)
+        elif mode == "separated":
+            it = iter(iterable)
+            for s in it:
+                fp.write(s)
+                break
+            for s in it:
+                fp.write(sep + s)
+        else:
+            for s in iterable:
+                fp.write(s + sep)
+        return
+    if mode == "preceded":
+        joiner = join_preceded
+    elif mode == "separated":
+        joiner = join_separated
+    else:
+        joiner = join_terminated
+    batch: list[AnyStr] = []
+    size = 0
+    seplen = len(sep)
     for s in iterable:
-        fp.write(s)
-        fp.write(sep)
+        batch.append(s)
+        size += len(s) + seplen
+        if size >= chunk_size:
+            fp.write(joiner(batch, sep))
+            batch.clear()
+            size = 0
+            if mode == "separated":
+                # Later batches need a separator between them and the batch
+                # before
+                joiner = join_preceded
+    if batch:
+        fp.write(joiner(batch, sep))
+
+
+def _read(
+    fp: IO[AnyStr],
+    sep: AnyStr | re.Pattern[AnyStr],
+    mode: Literal["preceded", "separated", "terminated"],
+    retain: bool,
+    chunk_size: int,
+) -> Iterator[AnyStr]:
+    """
+    Implementation of the ``read_*`` functions.  Each batch of entries from
+    `_read_batches()` is converted to the form for ``mode`` as a whole, rather
+    than by passing every entry through a chain of generators.
+    """
+    if not isinstance(sep, (bytes, str)):
+        warn(
+            "Passing a regular expression separator to a read_*() function is"
+            " deprecated and will be removed in v1.0",
+            DeprecationWarning,
+        )
+    if (
+        mode == "terminated"
+        and retain
+        and isinstance(fp, io.BufferedIOBase)
+        and sep == b"\n"
+    ):
+        # Buffered binary filehandles' own readlines() splits on b"\n" in
+        # exactly this manner, without any intermediate lists or
+        # concatenation on our part
+        for lines in iter(partial(fp.readlines, chunk_size), []):
+            yield from lines
+        return
+    first = True
+    # When reading preceded segments with `retain`, the last separator of the
+    # previous batch, which goes at the start of the next batch's first segment
+    hold: Optional[AnyStr] = None
+    for segments, separators, final in _read_batches(fp, sep, retain, chunk_size):
+        if mode == "terminated":
+            if final:
+                # Omits empty trailing entry
+                if segments[0]:
+                    yield segments[0]
+            elif retain:
+                yield from [a + b for a, b in zip(segments, separators)]
+            else:
+                yield from segments
+        elif mode == "preceded":
+            # Omits empty leading entry
+            if first:
+                if segments[0]:
+                    yield segments[0]
+                first = False
+            elif retain:
+                assert hold is not None
+                yield hold + segments[0]
+            else:
+                yield segments[0]
+            if retain:
+                yield from [a + b for a, b in zip(separators, segments[1:])]
+                if separators:
+                    hold = separators[-1]
+            else:
+                yield from segments[1:]
+        elif retain:
+            yield from _interleave(segments, separators)
+        else:
+            yield from segments
 
 
-def _join_pairs(iterable: Iterable[AnyStr]) -> Iterator[AnyStr]:
+def _read_batches(
+    fp: IO[AnyStr],
+    sep: AnyStr | re.Pattern[AnyStr],
+    retain: bool,
+    chunk_size: int,
+) -> Iterator[tuple[list[AnyStr], list[AnyStr], bool]]:
     """
-    Concatenate each pair of consecutive strings in ``iterable``.  If there are
-    an odd number of items in ``iterable``, the last one will be returned
-    unmodified.
+    Read segments separated by ``sep`` from ``fp`` and yield them in batches.
+    Each batch is a triple of a list of segments, a list of the separators
+    that follow them (empty if ``retain`` is false), and a boolean indicating
+    whether it is the final batch.  The final batch consists of just the
+    segment at the end of the input, with no separators.
     """
-    i = iter(iterable)
-    for a in i:
-        try:
-            b = next(i)
-        except StopIteration:
-            yield a
-            return
+    empty = fp.read(0)  # b'' or u'' as appropriate
+    # Check for a str/bytes mismatch up front so that it's reported the same
+    # way no matter what (or how much) the file contains
+    pattern = sep if isinstance(sep, (bytes, str)) else sep.pattern
+    # Compare against the base type so that subclasses of str and bytes are
+    # accepted
+    septype = str if isinstance(pattern, str) else bytes
+    if not isinstance(empty, septype):
+        raise TypeError(
+            f"Cannot split {type(empty).__name__} data on a"
+            f" {septype.__name__} separator"
+        )
+    literal: Optional[AnyStr]
+    seppattern: Optional[re.Pattern[AnyStr]]
+    if isinstance(sep, (bytes, str)) and sep:
+        # Literal separators can be split on directly without a regex
+        literal = sep
+        seppattern = None
+    else:
+        seppattern = _ensure_compiled(sep)
+        # If every match of the regex must begin with a certain literal
+        # string, don't bother running the regex until that literal has been
+        # read
+        literal = _required_literal(seppattern)
+    # Chunks that can't contain a separator are set aside in `pending` and
+    # only joined together once one might turn up, so that a long stretch
+    # without any separators isn't repeatedly copied.
+    pending: list[AnyStr] = []
+    # The pending data that hasn't yet been checked for `literal`, minus any
+    # prefix that has been ruled out.  Only the last `overlap` characters of
+    # previously-checked data need to be rechecked when a new chunk arrives,
+    # in case `literal` straddles a chunk boundary.
+    edge = empty
+    overlap = len(literal) - 1 if literal is not None else 0
+    for chunk in iter(partial(fp.read, chunk_size), empty):
+        pending.append(chunk)
+        if (
+            literal is not None
+            and literal not in chunk
+            and literal not in edge + chunk[:overlap]
+        ):
+            edge = (edge + chunk[-overlap:])[-overlap:] if overlap else empty
+            continue
+        buff = empty.join(pending)
+        if seppattern is None:
+            assert literal is not None
+            segments = buff.split(literal)
+            separators = [literal] * (len(segments) - 1) if retain else []
         else:
-            yield a + b
+            segments, separators = _regex_split(buff, seppattern, retain)
+        tail = segments.pop()
+        pending = [tail]
+        edge = tail
+        if segments:
+            yield (segments, separators, False)
+    yield ([empty.join(pending)], [], True)
+
+
+def _join_pairs(entries: list[AnyStr]) -> list[AnyStr]:
+    """
+    Concatenate each pair of consecutive strings in ``entries``.  If there are
+    an odd number of items in ``entries``, the last one will be returned
+    unmodified.
+    """
+    pairs = [a + b for a, b in zip(entries[::2], entries[1::2])]
+    if len(entries) % 2:
+        pairs.append(entries[-1])
+    return pairs
+
+
+def _regex_split(
+    s: AnyStr, pattern: re.Pattern[AnyStr], retain: bool
+) -> tuple[list[AnyStr], list[AnyStr]]:
+    """
+    Split ``s`` on the regex ``pattern`` in the manner of `split_separated()`,
+    returning a list of the segments and a list of the separators between
+    them.  If ``retain`` is false, the list of separators is left empty.
+    """
+    if not pattern.groups:
+        # Without any capturing groups, `Pattern.split()` returns just the
+        # segments, and `Pattern.findall()` returns just the separators, both
+        # built entirely in C.
+        return (pattern.split(s), pattern.findall(s) if retain else [])
+    segments: list[AnyStr] = []
+    separators: list[AnyStr] = []
+    add_segment = segments.append
+    lastend = 0
+    if retain:
+        add_separator = separators.append
+        for m in pattern.finditer(s):
+            start, end = m.span()
+            add_segment(s[lastend:start])
+            add_separator(s[start:end])
+            lastend = end
+    else:
+        for m in pattern.finditer(s):
+            start, end = m.span()
+            add_segment(s[lastend:start])
+            lastend = end
+    add_segment(s[lastend:])
+    return (segments, separators)
+
+
+def _interleave(segments: list[AnyStr], separators: list[AnyStr]) -> list[AnyStr]:
+    """
+    Merge a list of segments with a list of the same length or one shorter
+    into a single list alternating between the two, starting with a segment
+    """
+    entries = segments + separators
+    entries[::2] = segments
+    entries[1::2] = separators
+    return entries
 
 
 def _ensure_compiled(sep: AnyStr | re.Pattern[AnyStr]) -> re.Pattern[AnyStr]:
     if isinstance(sep, (bytes, str)):
-        return re.compile(re.escape(sep))
+        return _compile_literal(sep)
     else:
         return sep
 
 
+@lru_cache(maxsize=256)
+def _compile_literal(sep: AnyStr) -> re.Pattern[AnyStr]:
+    """
+    Compile a regex matching the literal string ``sep``, caching the result so
+    that repeated calls with the same separator skip escaping & compilation
+    """
+    return re.compile(re.escape(sep))
+
+
+_REGEX_META = ".^$*+?{}[]\\|()"
+
+
+def _required_literal(pattern: re.Pattern[AnyStr]) -> Optional[AnyStr]:
+    """
+    Return a nonempty literal string that every match of ``pattern`` must
+    begin with, or `None` if no such string can be easily determined.  Only
+    the plain characters at the very start of the pattern are considered, and
+    any pattern containing alternation or flags that affect literal matching is
+    rejected outright.
+    """
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    src = pattern.pattern
+    chars = src if isinstance(src, str) else src.decode("latin-1")
+    if "|" in chars:
+        return None
+    i = 0
+    while i < len(chars) and chars[i] not in _REGEX_META:
+        i += 1
+    if chars[i : i + 1] in ("*", "?", "{"):
+        # The last plain character is optional or repeated
+        i -= 1
+    return src[:i] if i > 0 else None
+
+
 _EOL_RGX = re.compile(r"\r\n?|\n")
 
 
@@ -344,16 +674,23 @@ def ascii_splitlines(s: str, keepends: bool = False) -> list[str]:
     Like `str.splitlines()`, except it only treats ``"\\n"``, ``"\\r\\n"``, and
     ``"\\r"`` as line endings
     """
+    if not keepends:
+        # Normalize all line endings to "\n" and let `str.split()` do the rest
+        if "\r" in s:
+            s = s.replace("\r\n", "\n").replace("\r", "\n")
+        lines = s.split("\n")
+        if not lines[-1]:
+            lines.pop()
+        return lines
     lines = []
+    add_line = lines.append
     lastend = 0
     for m in _EOL_RGX.finditer(s):
-        if keepends:
-            lines.append(s[lastend : m.end()])
-        else:
-            lines.append(s[lastend : m.start()])
-        lastend = m.end()
+        end = m.end()
+        add_line(s[lastend:end])
+        lastend = end
     if lastend < len(s):
-        lines.append(s[lastend:])
+        add_line(s[lastend:])
     return lines
 
 
@@ -369,12 +706,16 @@ def read_paragraphs(fp: Iterable[str]) -> Iterator[str]:
     Only ``"\\n"``, ``"\\r\\n"``, and ``"\\r"`` are recognized as line endings.
     """
     para: list[str] = []
+    # Whether the last line added to `para` was blank
+    last_was_blank = False
     for line in fp:
-        if not _is_blank(line) and para and _is_blank(para[-1]):
+        blank = _is_blank(line)
+        if last_was_blank and not blank:
             yield "".join(para)
             para = [line]
         else:
             para.append(line)
+        last_was_blank = blank
     if para:
         yield "".join(para)
 
@@ -383,10 +724,6 @@ def _is_blank(line: str) -> bool:
     return line in ("\n", "\r", "\r\n")
 
 
-_EOL_RGX2 = r"(?:\r\n|\r(?!\n)|\n)"
-_EOPARA_RGX = re.compile(rf"\A{_EOL_RGX2}+|{_EOL_RGX2}{{2,}}")
-
-
 def split_paragraphs(s: str) -> list[str]:
     """
     .. versionadded:: 0.3.0
@@ -397,4 +734,34 @@ def split_paragraphs(s: str) -> list[str]:
 
     Only ``"\\n"``, ``"\\r\\n"``, and ``"\\r"`` are recognized as line endings.
     """
-    return split_terminated(s, _EOPARA_RGX, retain=True)
+    if "\r" not in s:
+        return _split_lf_paragraphs(s)
+    return list(read_paragraphs(ascii_splitlines(s, keepends=True)))
+
+
+_NEWLINES_RGX = re.compile(r"\n*")
+
+
+def _split_lf_paragraphs(s: str) -> list[str]:
+    """
+    Implementation of `split_paragraphs()` for strings in which the only line
+    ending is ``"\\n"``.  Instead of splitting the string into lines and
+    regrouping them, the string is searched for ``"\\n\\n"`` (or a leading
+    ``"\\n"``), and each paragraph is cut off after the run of newlines found
+    there.
+    """
+    paras = []
+    start = 0
+    i = 0 if s.startswith("\n") else s.find("\n\n")
+    while i != -1:
+        m = _NEWLINES_RGX.match(s, i)
+        assert m is not None
+        end = m.end()
+        if end == len(s):
+            break
+        paras.append(s[start:end])
+        start = end
+        i = s.find("\n\n", end)
+    if start < len(s):
+        paras.append(s[start:])
+    return paras
@@ -1,7 +1,12 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from collections import deque
-from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 from dataclasses import dataclass
 import re
 from typing import AnyStr, Generic, Optional
@@ -20,11 +25,40 @@ class Splitter(ABC, Generic[AnyStr]):
     ``SplitterClass[str]``, or ``SplitterClass[bytes]``, as appropriate.
     """
 
+    __slots__ = (
+        "_items",
+        "_next_item",
+        "_buff",
+        "_pending",
+        "_scan_from",
+        "_overlap",
+        "_hold",
+        "_closed",
+        "_first",
+    )
+
     def __init__(self) -> None:
-        #: The output queue
-        self._items: deque[AnyStr] = deque()
+        #: The output queue.  This is a plain list rather than a
+        #: `collections.deque` so that `getall()` can usually hand it over
+        #: without copying it.
+        self._items: list[AnyStr] = []
+        #: The index in `_items` of the next item to be returned by `get()`
+        self._next_item: int = 0
         #: The buffer of unsplit input data
         self._buff: Optional[AnyStr] = None
+        #: Input received after `_buff` that has not yet been appended to it
+        #: because it cannot contain or complete a separator.  Concatenation is
+        #: put off until a separator may be present so that a long stretch of
+        #: input without any separators isn't copied on every `feed()`.
+        self._pending: list[AnyStr] = []
+        #: The index in `_buff` before which it is known that no separator
+        #: begins, so that searches can skip data that was already searched
+        #: before more input arrived
+        self._scan_from: int = 0
+        #: The maximum number of characters at the end of `_buff` that may be
+        #: the start of a separator that can't be recognized until more input
+        #: arrives
+        self._overlap: int = 1
         #: A "hold space" for holding intermediate states of compound output
         #: items
         self._hold: Optional[AnyStr] = None
@@ -34,14 +68,25 @@ class Splitter(ABC, Generic[AnyStr]):
         self._first: bool = True
 
     @abstractmethod
-    def _find_separator(self, data: AnyStr) -> Optional[tuple[int, int]]:
+    def _find_separator(self, data: AnyStr, pos: int) -> Optional[tuple[int, int]]:
         """
-        Find the first occurrence of a separator in ``data`` and return the
-        separator's starting and ending indices; if no separator is found,
-        return `None`.
+        Find the first occurrence of a separator in ``data`` at or after index
+        ``pos`` and return the separator's starting and ending indices; if no
+        separator is found, return `None`.  When `None` is returned, no
+        separator may begin anywhere in ``data`` after ``pos`` except in the
+        last `_overlap` characters.
         """
         ...
 
+    def _can_defer(self, data: AnyStr) -> bool:  # noqa: U100
+        """
+        Return true if appending ``data`` to the current input would not
+        produce any new separators, in which case splitting can be put off
+        until more input arrives.  This is only called when `_buff` is not
+        `None`.
+        """
+        return False
+
     @abstractmethod
     def _handle_segment(
         self, item: AnyStr, first: bool = False, last: bool = False
@@ -59,23 +104,36 @@ class Splitter(ABC, Generic[AnyStr]):
         """Process split separator ``item``"""
         ...
 
-    def _output(self, item: AnyStr) -> None:
-        """Append ``item`` to the output queue"""
-        self._items.append(item)
-
     def _split(self) -> None:
         """Split up the current contents of `_buff`"""
-        while self._buff:
-            span = self._find_separator(self._buff)
-            if span is None:
-                break
-            start, end = span
-            self._handle_segment(self._buff[:start], first=self._first)
-            self._first = False
-            self._handle_separator(self._buff[start:end])
-            self._buff = self._buff[end:]
-        if self._closed and self._buff is not None:
-            self._handle_segment(self._buff, first=self._first, last=True)
+        buff = self._buff
+        if buff:
+            # Rather than slicing each separator off of the front of the buffer
+            # as it's found (copying the rest of the buffer each time), keep
+            # track of our position and only discard the processed data once
+            # at the end.
+            pos = 0
+            search_from = self._scan_from
+            # Look up the methods once rather than on every iteration
+            find_separator = self._find_separator
+            handle_segment = self._handle_segment
+            handle_separator = self._handle_separator
+            first = self._first
+            while pos < len(buff):
+                span = find_separator(buff, search_from)
+                if span is None:
+                    break
+                start, end = span
+                handle_segment(buff[pos:start], first=first)
+                first = False
+                handle_separator(buff[start:end])
+                pos = search_from = end
+            if pos:
+                self._buff = buff = buff[pos:]
+                self._first = first
+            self._scan_from = max(len(buff) - self._overlap, 0)
+        if self._closed and buff is not None:
+            self._handle_segment(buff, first=self._first, last=True)
             self._buff = None
 
     def feed(self, data: AnyStr) -> None:
@@ -90,30 +148,84 @@ class Splitter(ABC, Generic[AnyStr]):
             raise SplitterClosedError("Cannot feed data to closed splitter")
         if self._buff is None:
             self._buff = data
+        elif self._can_defer(data):
+            self._pending.append(data)
+            return
         else:
-            self._buff += data
+            self._flush_pending([data])
         self._split()
 
+    def feed_many(self, chunks: Iterable[AnyStr]) -> None:
+        """
+        .. versionadded:: 0.6.0
+
+        Split each element of ``chunks`` as input in turn.  This has the same
+        effect as calling `feed()` on each element, but the combined input is
+        only split once, after all of the elements have been received.
+
+        :raises SplitterClosedError:
+            if `close()` has already been called on this splitter
+        """
+        if self._closed:
+            raise SplitterClosedError("Cannot feed data to closed splitter")
+        parts = list(chunks)
+        if self._buff is None:
+            if not parts:
+                return
+            self._buff = parts[0][0:0].join(parts)
+        else:
+            self._flush_pending(parts)
+        self._split()
+
+    def _flush_pending(self, extra: Sequence[AnyStr] = ()) -> None:
+        """
+        Append the contents of `_pending`, followed by ``extra``, to `_buff`.
+        If they cannot be joined (e.g., because `str` and `bytes` are mixed),
+        the splitter's state is left unchanged.
+        """
+        if self._pending or extra:
+            assert self._buff is not None
+            parts = [self._buff]
+            parts.extend(self._pending)
+            parts.extend(extra)
+            self._buff = self._buff[0:0].join(parts)
+            self._pending.clear()
+
     def get(self) -> AnyStr:
         """
         Retrieve the next unfetched item that has been split from the input.
 
         :raises SplitterEmptyError: if there are no items currently available
         """
-        try:
-            return self._items.popleft()
-        except IndexError:
+        i = self._next_item
+        if i >= len(self._items):
             raise SplitterEmptyError("No items available in splitter")
+        item = self._items[i]
+        i += 1
+        if i == len(self._items):
+            self._items.clear()
+            i = 0
+        elif i >= 1024 and 2 * i >= len(self._items):
+            # Discard fetched items once they make up most of the queue
+            del self._items[:i]
+            i = 0
+        self._next_item = i
+        return item
 
     @property
     def nonempty(self) -> bool:
         """Whether a subsequent call to `get()` would return an item"""
-        return bool(self._items)
+        return self._next_item < len(self._items)
 
     def getall(self) -> list[AnyStr]:
         """Retrieve all unfetched items that have been split from the input"""
-        items = list(self._items)
-        self._items.clear()
+        if self._next_item:
+            items = self._items[self._next_item :]
+            self._items.clear()
+            self._next_item = 0
+        else:
+            items = self._items
+            self._items = []
         return items
 
     def split(self, data: AnyStr, final: bool = False) -> list[AnyStr]:
@@ -146,6 +258,7 @@ class Splitter(ABC, Generic[AnyStr]):
         """
         self._closed = True
         if self._buff is not None:
+            self._flush_pending()
             self._split()
 
     @property
@@ -159,15 +272,19 @@ class Splitter(ABC, Generic[AnyStr]):
         the same parameters were constructed
         """
         self._items.clear()
+        self._next_item = 0
         self._buff = None
+        self._pending.clear()
+        self._scan_from = 0
         self._hold = None
         self._closed = False
         self._first = True
 
     def getstate(self) -> SplitterState[AnyStr]:
         """Retrieve a representation of the splitter's current state"""
+        self._flush_pending()
         return SplitterState(
-            items=list(self._items),
+            items=self._items[self._next_item :],
             buff=self._buff,
             hold=self._hold,
             closed=self._closed,
@@ -179,9 +296,11 @@ class Splitter(ABC, Generic[AnyStr]):
         Restore the state of the splitter to what it was when the corresponding
         `getstate()` call was made
         """
-        self._items.clear()
-        self._items.extend(state.items)
+        self._items[:] = state.items
+        self._next_item = 0
         self._buff = state.buff
+        self._pending.clear()
+        self._scan_from = 0
         self._hold = state.hold
         self._closed = state.closed
         self._first = state.first
@@ -233,6 +352,8 @@ class ConstantSplitter(Splitter[AnyStr]):
     A splitter that uses a single, fixed string as the separator
     """
 
+    __slots__ = ("_separator", "_retain")
+
     def __init__(self, separator: AnyStr, retain: bool = False) -> None:
         """
         :param AnyStr separator: The string to split the input on
@@ -245,15 +366,64 @@ class ConstantSplitter(Splitter[AnyStr]):
             raise ValueError("Separator cannot be empty")
         super().__init__()
         self._separator: AnyStr = separator
+        self._overlap = len(separator) - 1
         self._retain: bool = retain
 
-    def _find_separator(self, data: AnyStr) -> Optional[tuple[int, int]]:
-        try:
-            i = data.index(self._separator)
-        except ValueError:
-            return None
+    @abstractmethod
+    def _split(self) -> None:
+        """
+        Split up the current contents of `_buff`.  Subclasses do this directly
+        with `str.split()`/`bytes.split()` rather than with the generic
+        `_find_separator()` loop, so the remaining abstract methods are unused.
+        """
+        ...
+
+    def _find_separator(self, data: AnyStr, pos: int) -> Optional[tuple[int, int]]:
+        raise NotImplementedError("Not used by this class")  # pragma: no cover
+
+    def _handle_segment(
+        self, item: AnyStr, first: bool = False, last: bool = False
+    ) -> None:
+        raise NotImplementedError("Not used by this class")  # pragma: no cover
+
+    def _handle_separator(self, item: AnyStr) -> None:
+        raise NotImplementedError("Not used by this class")  # pragma: no cover
+
+    def _can_defer(self, data: AnyStr) -> bool:
+        if self._separator in data:
+            return False
+        elif not self._overlap:
+            return True
+        # Check whether a separator straddles the boundary with the previous
+        # input
+        last = self._pending[-1] if self._pending else self._buff
+        assert last is not None
+        if len(last) < self._overlap:
+            return False
+        return self._separator not in last[-self._overlap :] + data[: self._overlap]
+
+    def _split_buffer(self) -> list[AnyStr]:
+        """
+        Split the contents of `_buff` on the separator in a single pass and
+        return the segments.  If the splitter is not closed, the last segment
+        (which may be continued by further input) is kept in `_buff` rather
+        than returned; otherwise, `_buff` is cleared.
+        """
+        buff = self._buff
+        assert buff is not None
+        if not self._closed and buff.find(self._separator, self._scan_from) == -1:
+            # Don't search all of the pending data again next time
+            self._scan_from = max(len(buff) - self._overlap, 0)
+            return []
+        segments = buff.split(self._separator)
+        if len(segments) > 1:
+            self._first = False
+        if self._closed:
+            self._buff = None
         else:
-            return (i, i + len(self._separator))
+            self._buff = tail = segments.pop()
+            self._scan_from = max(len(tail) - self._overlap, 0)
+        return segments
 
 
 class TerminatedSplitter(ConstantSplitter[AnyStr]):
@@ -267,21 +437,20 @@ class TerminatedSplitter(ConstantSplitter[AnyStr]):
     Two adjacent separators always create an empty segment between them.
     """
 
-    def _handle_segment(
-        self, item: AnyStr, first: bool = False, last: bool = False  # noqa: U100
-    ) -> None:
-        if not last or item:
-            if self._retain and not last:
-                assert self._hold is None
-                self._hold = item
-            else:
-                self._output(item)
+    __slots__ = ()
 
-    def _handle_separator(self, item: AnyStr) -> None:
+    def _split(self) -> None:
+        segments = self._split_buffer()
+        # Once the input has ended, the last segment isn't terminated by a
+        # separator
+        last = segments.pop() if self._closed else None
         if self._retain:
-            assert self._hold is not None
-            self._output(self._hold + item)
-            self._hold = None
+            sep = self._separator
+            segments = [s + sep for s in segments]
+        if last:
+            # Omits empty trailing segment
+            segments.append(last)
+        self._items.extend(segments)
 
 
 class SeparatedSplitter(ConstantSplitter[AnyStr]):
@@ -303,14 +472,20 @@ class SeparatedSplitter(ConstantSplitter[AnyStr]):
     amount of times and not leaving any output unfetched).
     """
 
-    def _handle_segment(
-        self, item: AnyStr, first: bool = False, last: bool = False  # noqa: U100
-    ) -> None:
-        self._output(item)
+    __slots__ = ()
 
-    def _handle_separator(self, item: AnyStr) -> None:
+    def _split(self) -> None:
+        segments = self._split_buffer()
         if self._retain:
-            self._output(item)
+            # Follow each segment with a separator, except for the final
+            # segment once the input has ended
+            items = [self._separator] * (2 * len(segments))
+            items[::2] = segments
+            if self._closed:
+                items.pop()
+            self._items.extend(items)
+        else:
+            self._items.extend(segments)
 
 
 class PrecededSplitter(ConstantSplitter[AnyStr]):
@@ -324,23 +499,23 @@ class PrecededSplitter(ConstantSplitter[AnyStr]):
     Two adjacent separators always create an empty segment between them.
     """
 
-    def _handle_segment(
-        self, item: AnyStr, first: bool = False, last: bool = False  # noqa: U100
-    ) -> None:
-        if first:
-            if item:
-                self._output(item)
-        elif self._retain:
-            assert self._hold is not None
-            self._output(self._hold + item)
-            self._hold = None
-        else:
-            self._output(item)
+    __slots__ = ()
 
-    def _handle_separator(self, item: AnyStr) -> None:
+    def _split(self) -> None:
+        first = self._first
+        segments = self._split_buffer()
+        if first and segments:
+            # The first segment of the input is not preceded by a separator,
+            # and it is omitted if empty
+            head = segments.pop(0)
+            if head:
+                self._items.append(head)
         if self._retain:
-            assert self._hold is None
-            self._hold = item
+            # Every other segment is preceded by a separator, including one
+            # that was continued from earlier input
+            sep = self._separator
+            segments = [sep + s for s in segments]
+        self._items.extend(segments)
 
 
 class UniversalNewlineSplitter(Splitter[AnyStr]):
@@ -351,6 +526,8 @@ class UniversalNewlineSplitter(Splitter[AnyStr]):
     ``"\\n"``, ``"\\r\\n"``, and ``"\\r"``.
     """
 
+    __slots__ = ("_retain", "_translate", "_strs", "_next_lf")
+
     def __init__(self, retain: bool = False, translate: bool = True) -> None:
         """
         :param bool retain:
@@ -364,21 +541,60 @@ class UniversalNewlineSplitter(Splitter[AnyStr]):
         self._retain = retain
         self._translate = translate
         self._strs: Optional[NewlineStrs[AnyStr]] = None
+        #: The index of the next LF in the buffer being split (or -1 if there
+        #: are no more), so that input without any LFs isn't rescanned in full
+        #: for every CR.  This is only valid during a single `_split()` call;
+        #: `None` means that it has not been determined yet.
+        self._next_lf: Optional[int] = None
 
-    def _find_separator(self, data: AnyStr) -> Optional[tuple[int, int]]:
-        if self._strs is None:
-            self._strs = NewlineStrs.for_type(data)
-        return self._strs.search(data, self.closed)
+    def _split(self) -> None:
+        # Determine the newline strings once, when the first input arrives,
+        # rather than checking for them on every search
+        if self._strs is None and self._buff is not None:
+            self._strs = NewlineStrs.for_type(self._buff)
+        self._next_lf = None
+        super()._split()
+
+    def _can_defer(self, data: AnyStr) -> bool:
+        assert self._buff is not None
+        # `_strs` may not be set yet if `_buff` was restored by `setstate()`.
+        # The strings are looked up from `_buff` rather than ``data`` so that
+        # data of the wrong type is rejected instead of being deferred.
+        strs = NewlineStrs.for_type(self._buff)
+        # A CR at the end of the buffer is a separator no matter what follows
+        return (
+            strs.CR not in data
+            and strs.LF not in data
+            and not self._buff.endswith(strs.CR)
+        )
+
+    def _find_separator(self, data: AnyStr, pos: int) -> Optional[tuple[int, int]]:
+        assert self._strs is not None
+        CR, LF = self._strs.CR, self._strs.LF
+        # Rather than searching with a regex, find the first LF with
+        # `str.find()` and then look for a CR before it.
+        i = self._next_lf
+        if i is None or -1 < i < pos:
+            i = self._next_lf = data.find(LF, pos)
+        j = data.find(CR, pos) if i == -1 else data.find(CR, pos, i)
+        if j == -1:
+            return None if i == -1 else (i, i + 1)
+        elif j + 1 < len(data):
+            return (j, j + 2) if j + 1 == i else (j, j + 1)
+        elif self.closed:
+            return (j, j + 1)
+        else:
+            # A trailing CR may yet be followed by an LF
+            return None
 
     def _handle_segment(
         self, item: AnyStr, first: bool = False, last: bool = False  # noqa: U100
     ) -> None:
         if not last or item:
             if self._retain and not last:
-                assert self._hold is None
                 self._hold = item
             else:
-                self._output(item)
+                self._items.append(item)
 
     def _handle_separator(self, item: AnyStr) -> None:
         if self._retain:
@@ -386,7 +602,7 @@ class UniversalNewlineSplitter(Splitter[AnyStr]):
                 assert self._strs is not None
                 item = self._strs.LF
             assert self._hold is not None
-            self._output(self._hold + item)
+            self._items.append(self._hold + item)
             self._hold = None
 
 
@@ -400,6 +616,8 @@ class UnicodeNewlineSplitter(Splitter[str]):
     not `bytes`.
     """
 
+    __slots__ = ("_retain", "_translate")
+
     SEP_RGX = re.compile(r"\r\n?|[\n\v\f\x1C-\x1E\x85\u2028\u2029]")
 
     def __init__(self, retain: bool = False, translate: bool = True) -> None:
@@ -415,8 +633,13 @@ class UnicodeNewlineSplitter(Splitter[str]):
         self._retain = retain
         self._translate = translate
 
-    def _find_separator(self, data: str) -> Optional[tuple[int, int]]:
-        m = self.SEP_RGX.search(data)
+    def _can_defer(self, data: str) -> bool:
+        assert self._buff is not None
+        # A CR at the end of the buffer is a separator no matter what follows
+        return self.SEP_RGX.search(data) is None and not self._buff.endswith("\r")
+
+    def _find_separator(self, data: str, pos: int) -> Optional[tuple[int, int]]:
+        m = self.SEP_RGX.search(data, pos)
         if m and not (m.group() == "\r" and m.end() == len(data) and not self.closed):
             return m.span()
         else:
@@ -427,17 +650,16 @@ class UnicodeNewlineSplitter(Splitter[str]):
     ) -> None:
         if not last or item:
             if self._retain and not last:
-                assert self._hold is None
                 self._hold = item
             else:
-                self._output(item)
+                self._items.append(item)
 
     def _handle_separator(self, item: str) -> None:
         if self._retain:
             if self._translate:
                 item = "\n"
             assert self._hold is not None
-            self._output(self._hold + item)
+            self._items.append(self._hold + item)
             self._hold = None
 
 
@@ -450,6 +672,8 @@ class ParagraphSplitter(Splitter[AnyStr]):
     the ASCII newline sequences ``"\\n"``, ``"\\r\\n"``, and ``"\\r"``.
     """
 
+    __slots__ = ("_retain", "_translate", "_strs")
+
     def __init__(self, retain: bool = False, translate: bool = True) -> None:
         """
         :param bool retain:
@@ -465,59 +689,88 @@ class ParagraphSplitter(Splitter[AnyStr]):
         self._strs: Optional[NewlineStrs[AnyStr]] = None
 
     def _split(self) -> None:
-        if self._strs is None and self._buff is not None:
-            self._strs = NewlineStrs.for_type(self._buff)
-        pos = 0
-        while self._buff:
-            assert self._strs is not None
+        buff = self._buff
+        assert buff is not None
+        if self._strs is None:
+            self._strs = NewlineStrs.for_type(buff)
+        strs = self._strs
+        closed = self._closed
+        # Rather than slicing each paragraph off of the front of the buffer and
+        # rebuilding the buffer for each translated newline (both of which copy
+        # the rest of the buffer), keep track of where the unprocessed data
+        # starts and collect the translated pieces of the current paragraph,
+        # only rebuilding the buffer once at the end.
+        # The start of the unprocessed data in `buff`
+        para = 0
+        # Where to search for the next newline in `buff`
+        pos = self._scan_from
+        # `buff[para:copied]` has been translated into `pieces`
+        copied = 0
+        pieces: list[AnyStr] = []
+        while para < len(buff):
             if self._hold is None:
-                span = self._strs.search(self._buff, self.closed, pos=pos)
+                span = strs.search(buff, closed, pos=pos)
                 if span is None:
+                    # Only a trailing CR can remain to be searched
+                    pos = max(pos, len(buff) - 1)
                     break
                 start, end = span
-                if (self._first and start == 0) or self._strs.match(
-                    self._buff, pos=end, closed=self.closed
+                if end == len(buff) and not closed:
+                    # Whether this newline ends a paragraph depends on what
+                    # comes after it
+                    pos = start
+                    break
+                if (self._first and start == 0) or strs.match(
+                    buff, pos=end, closed=closed
                 ) is not None:
+                    pieces.append(buff[copied:start])
+                    text = buff[0:0].join(pieces)
+                    pieces.clear()
                     if self._retain:
-                        self._hold = self._buff[:start]
+                        self._hold = text
                     else:
-                        self._output(self._buff[:start])
-                        self._hold = self._buff[0:0]
-                    self._handle_separator(self._buff[start:end])
+                        self._items.append(text)
+                        self._hold = buff[0:0]
+                    self._handle_separator(buff[start:end])
                     self._first = False
-                    self._buff = self._buff[end:]
+                    para = copied = pos = end
                 else:
-                    if self._translate and self._buff[start:end] != self._strs.LF:
-                        self._buff = (
-                            self._buff[:start] + self._strs.LF + self._buff[end:]
-                        )
-                        end = start + 1
+                    if self._translate and buff[start:end] != strs.LF:
+                        pieces.append(buff[copied:start])
+                        pieces.append(strs.LF)
+                        copied = end
                     pos = end
             else:
-                end2 = self._strs.match(self._buff, self.closed)
+                end2 = strs.match(buff, closed, pos=para)
                 if end2 is None:
                     if self._retain:
-                        self._output(self._hold)
+                        self._items.append(self._hold)
                     self._hold = None
                 elif end2 == -1:
                     break
                 else:
-                    self._handle_separator(self._buff[:end2])
-                    self._buff = self._buff[end2:]
-                    pos = 0
-        if self._closed and self._buff is not None:
-            assert self._strs is not None
-            if self._buff:
+                    self._handle_separator(buff[para : para + end2])
+                    para = copied = pos = para + end2
+        if pieces:
+            pieces.append(buff[copied:])
+            rest = buff[0:0].join(pieces)
+        else:
+            rest = buff[para:]
+        # Positions at or after `copied` are shifted by the same amount
+        self._scan_from = pos + len(rest) - len(buff)
+        self._buff = rest
+        if closed:
+            if rest:
                 if not self._retain:
-                    length = self._strs.endmatch(self._buff)
+                    length = strs.endmatch(rest)
                     if length is not None:
-                        self._buff = self._buff[:-length]
-                self._output(self._buff)
+                        rest = rest[:-length]
+                self._items.append(rest)
             elif self._retain and self._hold is not None:
-                self._output(self._hold)
+                self._items.append(self._hold)
             self._buff = None
 
-    def _find_separator(self, data: AnyStr) -> Optional[tuple[int, int]]:
+    def _find_separator(self, data: AnyStr, pos: int) -> Optional[tuple[int, int]]:
         raise NotImplementedError("Not used by this subclass")  # pragma: no cover
 
     def _handle_segment(
@@ -591,22 +844,25 @@ class SplitterEmptyError(Exception):
     pass
 
 
-@dataclass
 class NewlineStrs(Generic[AnyStr]):
-    regex: re.Pattern[AnyStr]
-    CR: AnyStr
-    LF: AnyStr
+    # This is a plain slotted class rather than a dataclass (which can't use
+    # slots before Python 3.10) or a NamedTuple (which can't be generic before
+    # Python 3.11), as its attributes are read on every newline search.
 
-    @property
-    def CRLF(self) -> AnyStr:
-        return self.CR + self.LF
+    __slots__ = ("regex", "CR", "LF", "CRLF")
+
+    def __init__(self, regex: re.Pattern[AnyStr], CR: AnyStr, LF: AnyStr) -> None:
+        self.regex: re.Pattern[AnyStr] = regex
+        self.CR: AnyStr = CR
+        self.LF: AnyStr = LF
+        self.CRLF: AnyStr = CR + LF
 
-    @classmethod
-    def for_type(cls, data: AnyStr) -> NewlineStrs[AnyStr]:
+    @staticmethod
+    def for_type(data: AnyStr) -> NewlineStrs[AnyStr]:
         if isinstance(data, str):
-            return cls(regex=re.compile(r"\r\n?|\n"), CR="\r", LF="\n")
+            return _STR_NEWLINES
         else:
-            return cls(regex=re.compile(rb"\r\n?|\n"), CR=b"\r", LF=b"\n")
+            return _BYTES_NEWLINES
 
     def search(
         self, data: AnyStr, closed: bool, pos: int = 0
@@ -637,6 +893,11 @@ class NewlineStrs(Generic[AnyStr]):
             return None
 
 
+_STR_NEWLINES = NewlineStrs(regex=re.compile(r"\r\n?|\n"), CR="\r", LF="\n")
+
+_BYTES_NEWLINES = NewlineStrs(regex=re.compile(rb"\r\n?|\n"), CR=b"\r", LF=b"\n")
+
+
 @dataclass(repr=False)
 class SplitterState(Generic[AnyStr]):
     """
@@ -1,6 +1,16 @@
 from __future__ import annotations
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import AnyStr, Callable, IO, Iterable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Callable,
+    IO,
+    Iterable,
+    Iterator,
+    Optional,
+)
 import pytest
 from pytest_subtests import SubTests
 from linesep import (
@@ -12,7 +22,7 @@ from linesep import (
     write_terminated,
 )
 
-SCENARIOS = [
+SCENARIOS: list[tuple[str, dict[str, Any]]] = [
     (
         "empty",
         {
@@ -57,19 +67,43 @@ SCENARIOS = [
 
 # Callable and Iterable need to be from typing for pre-Python 3.9 compatibility
 Joiner = Callable[[Iterable[AnyStr], AnyStr], AnyStr]
-Writer = Callable[[IO[AnyStr], Iterable[AnyStr], AnyStr], None]
+
+if TYPE_CHECKING:
+    from typing import Protocol
+
+    class Writer(Protocol):
+        def __call__(
+            self,
+            fp: IO[AnyStr],
+            iterable: Iterable[AnyStr],
+            sep: AnyStr,
+            chunk_size: Optional[int] = None,
+        ) -> None: ...
+
+
+MODES = [
+    (join_separated, write_separated, "separated"),
+    (join_terminated, write_terminated, "terminated"),
+    (join_preceded, write_preceded, "preceded"),
+]
 
 
 @pytest.mark.parametrize(
-    "joiner,writer,entries,sep,joined",
+    "joiner,writer,entries,sep,joined,bentries,bsep,bjoined",
     [
-        pytest.param(joiner, writer, v["entries"], v["sep"], v[mode], id=k)
+        pytest.param(
+            joiner,
+            writer,
+            v["entries"],
+            v["sep"],
+            v[mode],
+            [e.encode("utf-8") for e in v["entries"]],
+            v["sep"].encode("utf-8"),
+            v[mode].encode("utf-8"),
+            id=k,
+        )
         for k, v in SCENARIOS
-        for joiner, writer, mode in [
-            (join_separated, write_separated, "separated"),
-            (join_terminated, write_terminated, "terminated"),
-            (join_preceded, write_preceded, "preceded"),
-        ]
+        for joiner, writer, mode in MODES
     ],
 )
 def test_join(
@@ -79,21 +113,93 @@ def test_join(
     entries: list[str],
     sep: str,
     joined: str,
-    tmp_path: Path,
+    bentries: list[bytes],
+    bsep: bytes,
+    bjoined: bytes,
 ) -> None:
-    bentries = [e.encode("utf-8") for e in entries]
     with subtests.test("join-str"):
         assert joiner(entries, sep) == joined
     with subtests.test("join-bytes"):
-        assert joiner(bentries, sep.encode("utf-8")) == joined.encode("utf-8")
+        assert joiner(bentries, bsep) == bjoined
+    with subtests.test("write-str"):
+        fp = StringIO(newline="")
+        writer(fp, entries, sep)
+        assert fp.getvalue() == joined
+    with subtests.test("write-bytes"):
+        bfp = BytesIO()
+        writer(bfp, bentries, bsep)
+        assert bfp.getvalue() == bjoined
+    with subtests.test("write-str-chunked"):
+        fp = StringIO(newline="")
+        writer(fp, entries, sep, chunk_size=4)
+        assert fp.getvalue() == joined
+
+
+@pytest.mark.parametrize(
+    "writer,joined",
+    [
+        (write_separated, "foo\nbar"),
+        (write_terminated, "foo\nbar\n"),
+        (write_preceded, "\nfoo\nbar"),
+    ],
+)
+def test_write_file(
+    subtests: SubTests, writer: Writer, joined: str, tmp_path: Path
+) -> None:
     with subtests.test("write-str"):
         p = tmp_path / "text"
         with p.open("w", encoding="utf-8", newline="") as fp:
-            writer(fp, entries, sep)
+            writer(fp, ["foo", "bar"], "\n")
         with p.open(encoding="utf-8", newline="") as fp:
             assert fp.read() == joined
     with subtests.test("write-bytes"):
         p = tmp_path / "bytes"
-        with p.open("wb") as fp:
-            writer(fp, bentries, sep.encode("utf-8"))
+        with p.open("wb") as bfp:
+            writer(bfp, [b"foo", b"bar"], b"\n")
         assert p.read_bytes() == joined.encode("utf-8")
+
+
+class WriteRecorder(StringIO):
+    def __init__(self) -> None:
+        super().__init__(newline="")
+        self.writes: list[str] = []
+
+    def write(self, s: str) -> int:
+        self.writes.append(s)
+        return super().write(s)
+
+
+@pytest.mark.parametrize(
+    "writer,writes",
+    [
+        (write_separated, ["foo\nbar", "\nbaz\nquux"]),
+        (write_terminated, ["foo\nbar\n", "baz\nquux\n"]),
+        (write_preceded, ["\nfoo\nbar", "\nbaz\nquux"]),
+    ],
+)
+def test_write_chunk_size(writer: Writer, writes: list[str]) -> None:
+    fp = WriteRecorder()
+    writer(fp, iter(["foo", "bar", "baz", "quux"]), "\n", chunk_size=8)
+    assert fp.writes == writes
+    assert fp.getvalue() == "".join(writes)
+
+
+@pytest.mark.parametrize(
+    "writer,writes",
+    [
+        (write_separated, ["foo", "\nbar", "\nbaz"]),
+        (write_terminated, ["foo\n", "bar\n", "baz\n"]),
+        (write_preceded, ["\nfoo", "\nbar", "\nbaz"]),
+    ],
+)
+def test_write_each_entry(writer: Writer, writes: list[str]) -> None:
+    def entries() -> Iterator[str]:
+        yield "foo"
+        yield "bar"
+        yield "baz"
+        raise RuntimeError("Stop")
+
+    fp = WriteRecorder()
+    with pytest.raises(RuntimeError):
+        writer(fp, entries(), "\n")
+    assert fp.writes == writes
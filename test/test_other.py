@@ -121,6 +121,16 @@ TEXT_PARAGRAPHS = [
         "This is test text.\n \n\nThis is a textual test.\n",
         ["This is test text.\n \n\n", "This is a textual test.\n"],
     ),
+    (
+        "\nThis is test text.\n\n\nThis is a textual test.\n\n"
+        "This is the text that tests.\nIt tests text.\n\n\n",
+        [
+            "\n",
+            "This is test text.\n\n\n",
+            "This is a textual test.\n\n",
+            "This is the text that tests.\nIt tests text.\n\n\n",
+        ],
+    ),
 ]
 
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from io import BytesIO, StringIO
 from pathlib import Path
 import re
 import sys
-from typing import TYPE_CHECKING, AnyStr, IO, List, cast
+from typing import TYPE_CHECKING, Any, AnyStr, IO, Optional
 import pytest
 from pytest_subtests import SubTests
 from linesep import (
+    DEFAULT_CHUNK_SIZE,
+    iter_separated_offsets,
     read_preceded,
     read_separated,
     read_terminated,
@@ -14,6 +17,7 @@ from linesep import (
     split_separated,
     split_terminated,
 )
+from linesep.funcs import _required_literal
 
 if TYPE_CHECKING:
     if sys.version_info[:2] >= (3, 8):
@@ -35,11 +39,47 @@ if TYPE_CHECKING:
             fp: IO[AnyStr],
             sep: AnyStr | re.Pattern[AnyStr],
             retain: bool = False,
-            chunk_size: int = 512,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
         ) -> Iterator[AnyStr]: ...
 
 
-SCENARIOS = {
+# The "straddling_delim" and "big_entry" scenarios are designed around a chunk
+# size of 512, so make sure it's tested in addition to the default.
+CHUNK_SIZES = [512, DEFAULT_CHUNK_SIZE]
+
+# The text before and after the "\r\n" separator in "straddling_delim"
+STRADDLING_HEAD = (
+    "This test is intended to test splitting when the separator is a"
+    " multicharacter delimiter that straddles the boundary between the"
+    " 512-character chunks that the `read_*` functions divide their"
+    " input into.  Unfortunately, I'm already bored of writing this"
+    " test, and I still have 237 characters left to go.  Lorem ipsum"
+    " dolor sit amet, consectetur adipisicing elit, sed do eiusmod"
+    " tempor incididunt ut labore et dolore magna aliqua.  Ut enim ad"
+    " minim veniam, quis nostrud exercitation ullamco Here it comes"
+    "  --->  |"
+)
+STRADDLING_TAIL = "|  <--- There should be a split right there; is there?"
+
+# The text before and after the "\r\n" separator in "big_entry"
+BIG_ENTRY_HEAD = (
+    "This test is intended to test splitting when a single entry is"
+    " longer than the 512-character chunk size.  Lorem ipsum dolor sit"
+    " amet, consectetur adipisicing elit, sed do eiusmod tempor"
+    " incididunt ut labore et dolore magna aliqua.  Ut enim ad minim"
+    " veniam, quis nostrud exercitation ullamco laboris nisi ut"
+    " aliquip ex ea commodo consequat.  Duis aute irure dolor in"
+    " reprehenderit in voluptate velit esse cillum dolore eu fugiat"
+    " nulla pariatur.  Excepteur sint occaecat cupidatat non proident,"
+    " sunt in culpa qui officia|"
+)
+BIG_ENTRY_TAIL = "| deserunt mollit anim id est laborum."
+
+# Scenarios whose inputs are large enough to span more than one chunk; tests
+# on them are marked "slow"
+SLOW_SCENARIOS = {"straddling_delim", "big_entry"}
+
+SCENARIOS: dict[str, dict[str, Any]] = {
     "empty": {
         "text": "",
         "sep": "\n",
@@ -151,176 +191,24 @@ SCENARIOS = {
         "terminated_retained": ["abca|b", "c"],
     },
     "straddling_delim": {
-        "text": "This test is intended to test splitting when the separator is"
-        " a multicharacter delimiter that straddles the boundary"
-        " between the 512-character chunks that the `read_*` functions"
-        " divide their input into.  Unfortunately, I'm already bored"
-        " of writing this test, and I still have 237 characters left"
-        " to go.  Lorem ipsum dolor sit amet, consectetur adipisicing"
-        " elit, sed do eiusmod tempor incididunt ut labore et dolore"
-        " magna aliqua.  Ut enim ad minim veniam, quis nostrud"
-        " exercitation ullamco Here it comes  --->  |\r\n|  <--- There"
-        " should be a split right there; is there?",
+        "text": STRADDLING_HEAD + "\r\n" + STRADDLING_TAIL,
         "sep": "\r\n",
-        "preceded": [
-            "This test is intended to test splitting when the separator is a"
-            " multicharacter delimiter that straddles the boundary between the"
-            " 512-character chunks that the `read_*` functions divide their"
-            " input into.  Unfortunately, I'm already bored of writing this"
-            " test, and I still have 237 characters left to go.  Lorem ipsum"
-            " dolor sit amet, consectetur adipisicing elit, sed do eiusmod"
-            " tempor incididunt ut labore et dolore magna aliqua.  Ut enim ad"
-            " minim veniam, quis nostrud exercitation ullamco Here it comes"
-            "  --->  |",
-            "|  <--- There should be a split right there; is there?",
-        ],
-        "preceded_retained": [
-            "This test is intended to test splitting when the separator is a"
-            " multicharacter delimiter that straddles the boundary between the"
-            " 512-character chunks that the `read_*` functions divide their"
-            " input into.  Unfortunately, I'm already bored of writing this"
-            " test, and I still have 237 characters left to go.  Lorem ipsum"
-            " dolor sit amet, consectetur adipisicing elit, sed do eiusmod"
-            " tempor incididunt ut labore et dolore magna aliqua.  Ut enim ad"
-            " minim veniam, quis nostrud exercitation ullamco Here it comes"
-            "  --->  |",
-            "\r\n|  <--- There should be a split right there; is there?",
-        ],
-        "separated": [
-            "This test is intended to test splitting when the separator is a"
-            " multicharacter delimiter that straddles the boundary between the"
-            " 512-character chunks that the `read_*` functions divide their"
-            " input into.  Unfortunately, I'm already bored of writing this"
-            " test, and I still have 237 characters left to go.  Lorem ipsum"
-            " dolor sit amet, consectetur adipisicing elit, sed do eiusmod"
-            " tempor incididunt ut labore et dolore magna aliqua.  Ut enim ad"
-            " minim veniam, quis nostrud exercitation ullamco Here it comes"
-            "  --->  |",
-            "|  <--- There should be a split right there; is there?",
-        ],
-        "separated_retained": [
-            "This test is intended to test splitting when the separator is a"
-            " multicharacter delimiter that straddles the boundary between the"
-            " 512-character chunks that the `read_*` functions divide their"
-            " input into.  Unfortunately, I'm already bored of writing this"
-            " test, and I still have 237 characters left to go.  Lorem ipsum"
-            " dolor sit amet, consectetur adipisicing elit, sed do eiusmod"
-            " tempor incididunt ut labore et dolore magna aliqua.  Ut enim ad"
-            " minim veniam, quis nostrud exercitation ullamco Here it comes"
-            "  --->  |",
-            "\r\n",
-            "|  <--- There should be a split right there; is there?",
-        ],
-        "terminated": [
-            "This test is intended to test splitting when the separator is a"
-            " multicharacter delimiter that straddles the boundary between the"
-            " 512-character chunks that the `read_*` functions divide their"
-            " input into.  Unfortunately, I'm already bored of writing this"
-            " test, and I still have 237 characters left to go.  Lorem ipsum"
-            " dolor sit amet, consectetur adipisicing elit, sed do eiusmod"
-            " tempor incididunt ut labore et dolore magna aliqua.  Ut enim ad"
-            " minim veniam, quis nostrud exercitation ullamco Here it comes"
-            "  --->  |",
-            "|  <--- There should be a split right there; is there?",
-        ],
-        "terminated_retained": [
-            "This test is intended to test splitting when the separator is a"
-            " multicharacter delimiter that straddles the boundary between the"
-            " 512-character chunks that the `read_*` functions divide their"
-            " input into.  Unfortunately, I'm already bored of writing this"
-            " test, and I still have 237 characters left to go.  Lorem ipsum"
-            " dolor sit amet, consectetur adipisicing elit, sed do eiusmod"
-            " tempor incididunt ut labore et dolore magna aliqua.  Ut enim ad"
-            " minim veniam, quis nostrud exercitation ullamco Here it comes"
-            "  --->  |\r\n",
-            "|  <--- There should be a split right there; is there?",
-        ],
+        "preceded": [STRADDLING_HEAD, STRADDLING_TAIL],
+        "preceded_retained": [STRADDLING_HEAD, "\r\n" + STRADDLING_TAIL],
+        "separated": [STRADDLING_HEAD, STRADDLING_TAIL],
+        "separated_retained": [STRADDLING_HEAD, "\r\n", STRADDLING_TAIL],
+        "terminated": [STRADDLING_HEAD, STRADDLING_TAIL],
+        "terminated_retained": [STRADDLING_HEAD + "\r\n", STRADDLING_TAIL],
     },
     "big_entry": {
-        "text": "This test is intended to test splitting when a single entry"
-        " is longer than the 512-character chunk size.  Lorem ipsum"
-        " dolor sit amet, consectetur adipisicing elit, sed do"
-        " eiusmod tempor incididunt ut labore et dolore magna aliqua."
-        "  Ut enim ad minim veniam, quis nostrud exercitation ullamco"
-        " laboris nisi ut aliquip ex ea commodo consequat.  Duis aute"
-        " irure dolor in reprehenderit in voluptate velit esse cillum"
-        " dolore eu fugiat nulla pariatur.  Excepteur sint occaecat"
-        " cupidatat non proident, sunt in culpa qui officia|\r\n|"
-        " deserunt mollit anim id est laborum.",
+        "text": BIG_ENTRY_HEAD + "\r\n" + BIG_ENTRY_TAIL,
         "sep": "\r\n",
-        "preceded": [
-            "This test is intended to test splitting when a single entry is"
-            " longer than the 512-character chunk size.  Lorem ipsum dolor sit"
-            " amet, consectetur adipisicing elit, sed do eiusmod tempor"
-            " incididunt ut labore et dolore magna aliqua.  Ut enim ad minim"
-            " veniam, quis nostrud exercitation ullamco laboris nisi ut"
-            " aliquip ex ea commodo consequat.  Duis aute irure dolor in"
-            " reprehenderit in voluptate velit esse cillum dolore eu fugiat"
-            " nulla pariatur.  Excepteur sint occaecat cupidatat non proident,"
-            " sunt in culpa qui officia|",
-            "| deserunt mollit anim id est laborum.",
-        ],
-        "preceded_retained": [
-            "This test is intended to test splitting when a single entry is"
-            " longer than the 512-character chunk size.  Lorem ipsum dolor sit"
-            " amet, consectetur adipisicing elit, sed do eiusmod tempor"
-            " incididunt ut labore et dolore magna aliqua.  Ut enim ad minim"
-            " veniam, quis nostrud exercitation ullamco laboris nisi ut"
-            " aliquip ex ea commodo consequat.  Duis aute irure dolor in"
-            " reprehenderit in voluptate velit esse cillum dolore eu fugiat"
-            " nulla pariatur.  Excepteur sint occaecat cupidatat non proident,"
-            " sunt in culpa qui officia|",
-            "\r\n| deserunt mollit anim id est laborum.",
-        ],
-        "separated": [
-            "This test is intended to test splitting when a single entry is"
-            " longer than the 512-character chunk size.  Lorem ipsum dolor sit"
-            " amet, consectetur adipisicing elit, sed do eiusmod tempor"
-            " incididunt ut labore et dolore magna aliqua.  Ut enim ad minim"
-            " veniam, quis nostrud exercitation ullamco laboris nisi ut"
-            " aliquip ex ea commodo consequat.  Duis aute irure dolor in"
-            " reprehenderit in voluptate velit esse cillum dolore eu fugiat"
-            " nulla pariatur.  Excepteur sint occaecat cupidatat non proident,"
-            " sunt in culpa qui officia|",
-            "| deserunt mollit anim id est laborum.",
-        ],
-        "separated_retained": [
-            "This test is intended to test splitting when a single entry is"
-            " longer than the 512-character chunk size.  Lorem ipsum dolor sit"
-            " amet, consectetur adipisicing elit, sed do eiusmod tempor"
-            " incididunt ut labore et dolore magna aliqua.  Ut enim ad minim"
-            " veniam, quis nostrud exercitation ullamco laboris nisi ut"
-            " aliquip ex ea commodo consequat.  Duis aute irure dolor in"
-            " reprehenderit in voluptate velit esse cillum dolore eu fugiat"
-            " nulla pariatur.  Excepteur sint occaecat cupidatat non proident,"
-            " sunt in culpa qui officia|",
-            "\r\n",
-            "| deserunt mollit anim id est laborum.",
-        ],
-        "terminated": [
-            "This test is intended to test splitting when a single entry is"
-            " longer than the 512-character chunk size.  Lorem ipsum dolor sit"
-            " amet, consectetur adipisicing elit, sed do eiusmod tempor"
-            " incididunt ut labore et dolore magna aliqua.  Ut enim ad minim"
-            " veniam, quis nostrud exercitation ullamco laboris nisi ut"
-            " aliquip ex ea commodo consequat.  Duis aute irure dolor in"
-            " reprehenderit in voluptate velit esse cillum dolore eu fugiat"
-            " nulla pariatur.  Excepteur sint occaecat cupidatat non proident,"
-            " sunt in culpa qui officia|",
-            "| deserunt mollit anim id est laborum.",
-        ],
-        "terminated_retained": [
-            "This test is intended to test splitting when a single entry is"
-            " longer than the 512-character chunk size.  Lorem ipsum dolor sit"
-            " amet, consectetur adipisicing elit, sed do eiusmod tempor"
-            " incididunt ut labore et dolore magna aliqua.  Ut enim ad minim"
-            " veniam, quis nostrud exercitation ullamco laboris nisi ut"
-            " aliquip ex ea commodo consequat.  Duis aute irure dolor in"
-            " reprehenderit in voluptate velit esse cillum dolore eu fugiat"
-            " nulla pariatur.  Excepteur sint occaecat cupidatat non proident,"
-            " sunt in culpa qui officia|\r\n",
-            "| deserunt mollit anim id est laborum.",
-        ],
+        "preceded": [BIG_ENTRY_HEAD, BIG_ENTRY_TAIL],
+        "preceded_retained": [BIG_ENTRY_HEAD, "\r\n" + BIG_ENTRY_TAIL],
+        "separated": [BIG_ENTRY_HEAD, BIG_ENTRY_TAIL],
+        "separated_retained": [BIG_ENTRY_HEAD, "\r\n", BIG_ENTRY_TAIL],
+        "terminated": [BIG_ENTRY_HEAD, BIG_ENTRY_TAIL],
+        "terminated_retained": [BIG_ENTRY_HEAD + "\r\n", BIG_ENTRY_TAIL],
     },
     "empty_sep": {
         "text": "This is test text.",
@@ -330,15 +218,18 @@ SCENARIOS = {
         "separated": ["", *"This is test text.", ""],
         "preceded_retained": [*"This is test text.", ""],
         "terminated_retained": ["", *"This is test text."],
-        "separated_retained": [""]
-        # We need to use typing.List here for pre-Python 3.9 compatibility:
-        + sum([["", c] for c in "This is test text."], cast(List[str], [])) + ["", ""],
+        "separated_retained": [
+            "",
+            *(x for c in "This is test text." for x in ("", c)),
+            "",
+            "",
+        ],
     },
 }
 
 
 @pytest.mark.parametrize(
-    "splitter,reader,text,sep,splitvals,retain",
+    "splitter,reader,text,sep,splitvals,btext,bsep,splitbytes,retain",
     [
         pytest.param(
             splitter,
@@ -346,8 +237,12 @@ SCENARIOS = {
             v["text"],
             v["sep"],
             v[f"{mode}{suffix}"],
+            v["text"].encode("utf-8"),
+            v["sep"].encode("utf-8"),
+            [e.encode("utf-8") for e in v[f"{mode}{suffix}"]],
             retain,
             id=f"{k}{suffix}",
+            marks=pytest.mark.slow if k in SLOW_SCENARIOS else (),
         )
         for k, v in SCENARIOS.items()
         for splitter, reader, mode in [
@@ -365,31 +260,106 @@ def test_split(
     text: str,
     sep: str,
     splitvals: list[str],
+    btext: bytes,
+    bsep: bytes,
+    splitbytes: list[bytes],
     retain: bool,
-    tmp_path: Path,
 ) -> None:
-    splitbytes = [e.encode("utf-8") for e in splitvals]
     with subtests.test("split-str"):
         assert splitter(text, sep, retain=retain) == splitvals
     with subtests.test("split-bytes"):
-        assert (
-            splitter(text.encode("utf-8"), sep.encode("utf-8"), retain=retain)
-            == splitbytes
+        assert splitter(btext, bsep, retain=retain) == splitbytes
+    for chunk_size in CHUNK_SIZES:
+        with subtests.test("read-str", chunk_size=chunk_size):
+            fp = StringIO(text, newline="")
+            assert (
+                list(reader(fp, sep, retain=retain, chunk_size=chunk_size)) == splitvals
+            )
+        with subtests.test("read-bytes", chunk_size=chunk_size):
+            bfp = BytesIO(btext)
+            assert (
+                list(reader(bfp, bsep, retain=retain, chunk_size=chunk_size))
+                == splitbytes
+            )
+
+
+@pytest.mark.parametrize(
+    "reader,text,sep,splitvals,retain",
+    [
+        pytest.param(
+            reader,
+            SCENARIOS[k]["text"],
+            SCENARIOS[k]["sep"],
+            SCENARIOS[k][f"{mode}{suffix}"],
+            retain,
+            id=f"{k}{suffix}",
+            marks=pytest.mark.slow if k in SLOW_SCENARIOS else (),
         )
-    with subtests.test("read-str"):
-        p = tmp_path / "text"
-        with p.open("w", encoding="utf-8", newline="") as fp:
-            fp.write(text)
-        with p.open(encoding="utf-8", newline="") as fp:
-            assert list(reader(fp, sep, retain=retain)) == splitvals
-    with subtests.test("read-bytes"):
-        p = tmp_path / "bytes"
-        p.write_bytes(text.encode("utf-8"))
-        with p.open("rb") as fp:
-            assert list(reader(fp, sep.encode("utf-8"), retain=retain)) == splitbytes
+        for k in ["no_sep", "two_seps", "straddling_delim", "big_entry"]
+        for reader, mode in [
+            (read_separated, "separated"),
+            (read_terminated, "terminated"),
+            (read_preceded, "preceded"),
+        ]
+        for retain, suffix in [(False, ""), (True, "_retained")]
+    ],
+)
+def test_read_file(
+    subtests: SubTests,
+    reader: Reader,
+    text: str,
+    sep: str,
+    splitvals: list[str],
+    retain: bool,
+    tmp_path: Path,
+) -> None:
+    for chunk_size in CHUNK_SIZES:
+        with subtests.test("read-str", chunk_size=chunk_size):
+            p = tmp_path / "text"
+            with p.open("w", encoding="utf-8", newline="") as fp:
+                fp.write(text)
+            with p.open(encoding="utf-8", newline="") as fp:
+                assert (
+                    list(reader(fp, sep, retain=retain, chunk_size=chunk_size))
+                    == splitvals
+                )
+        with subtests.test("read-bytes", chunk_size=chunk_size):
+            p = tmp_path / "bytes"
+            p.write_bytes(text.encode("utf-8"))
+            with p.open("rb") as bfp:
+                assert list(
+                    reader(
+                        bfp,
+                        sep.encode("utf-8"),
+                        retain=retain,
+                        chunk_size=chunk_size,
+                    )
+                ) == [e.encode("utf-8") for e in splitvals]
+
+
+@pytest.mark.parametrize(
+    "text,sep,splitvals",
+    [
+        pytest.param(v["text"], v["sep"], v["separated"], id=k)
+        for k, v in SCENARIOS.items()
+    ],
+)
+def test_iter_separated_offsets(
+    subtests: SubTests, text: str, sep: str, splitvals: list[str]
+) -> None:
+    with subtests.test("str"):
+        assert [text[a:b] for a, b in iter_separated_offsets(text, sep)] == splitvals
+    with subtests.test("bytes"):
+        btext = text.encode("utf-8")
+        assert [
+            btext[a:b] for a, b in iter_separated_offsets(btext, sep.encode("utf-8"))
+        ] == [e.encode("utf-8") for e in splitvals]
+    with subtests.test("regex"):
+        rgx = re.compile(re.escape(sep))
+        assert [text[a:b] for a, b in iter_separated_offsets(text, rgx)] == splitvals
 
 
-REGEX_SCENARIOS = {
+REGEX_SCENARIOS: dict[str, dict[str, Any]] = {
     "regex01": {
         "text": "abca|bc",
         "sep": r"a|b",
@@ -410,17 +380,42 @@ REGEX_SCENARIOS = {
         "terminated": ["", "", "c", "|", "c"],
         "terminated_retained": ["a", "b", "ca", "|b", "c"],
     },
+    "regex_literal_prefix": {
+        "text": "fooXYbarXXYbazY",
+        "sep": "XX?Y",
+        "preceded": ["foo", "bar", "bazY"],
+        "preceded_retained": ["foo", "XYbar", "XXYbazY"],
+        "separated": ["foo", "bar", "bazY"],
+        "separated_retained": ["foo", "XY", "bar", "XXY", "bazY"],
+        "terminated": ["foo", "bar", "bazY"],
+        "terminated_retained": ["fooXY", "barXXY", "bazY"],
+    },
+    "regex_literal_absent": {
+        "text": "foo\nbar\nbaz",
+        "sep": "XX?Y",
+        "preceded": ["foo\nbar\nbaz"],
+        "preceded_retained": ["foo\nbar\nbaz"],
+        "separated": ["foo\nbar\nbaz"],
+        "separated_retained": ["foo\nbar\nbaz"],
+        "terminated": ["foo\nbar\nbaz"],
+        "terminated_retained": ["foo\nbar\nbaz"],
+    },
 }
 
+for v in REGEX_SCENARIOS.values():
+    v["textrgx"] = re.compile(v["sep"])
+    v["bytesrgx"] = re.compile(v["sep"].encode("utf-8"))
+
 
 @pytest.mark.parametrize(
-    "splitter,reader,text,sep,splitvals,retain",
+    "splitter,reader,text,textrgx,bytesrgx,splitvals,retain",
     [
         pytest.param(
             splitter,
             reader,
             v["text"],
-            v["sep"],
+            v["textrgx"],
+            v["bytesrgx"],
             v[f"{mode}{suffix}"],
             retain,
             id=f"{k}{suffix}",
@@ -439,28 +434,84 @@ def test_split_regex(
     splitter: Splitter,
     reader: Reader,
     text: str,
-    sep: str,
+    textrgx: re.Pattern[str],
+    bytesrgx: re.Pattern[bytes],
     splitvals: list[str],
     retain: bool,
-    tmp_path: Path,
 ) -> None:
-    textrgx = re.compile(sep)
-    bytesrgx = re.compile(sep.encode("utf-8"))
     splitbytes = [e.encode("utf-8") for e in splitvals]
     with subtests.test("split-str"):
         assert splitter(text, textrgx, retain=retain) == splitvals
     with subtests.test("split-bytes"):
         assert splitter(text.encode("utf-8"), bytesrgx, retain=retain) == splitbytes
-    with subtests.test("read-str"):
-        p = tmp_path / "text"
-        with p.open("w", encoding="utf-8", newline="") as fp:
-            fp.write(text)
-        with p.open(encoding="utf-8", newline="") as fp:
+    for chunk_size in [1, DEFAULT_CHUNK_SIZE]:
+        with subtests.test("read-str", chunk_size=chunk_size):
+            fp = StringIO(text, newline="")
             with pytest.deprecated_call():
-                assert list(reader(fp, textrgx, retain=retain)) == splitvals
-    with subtests.test("read-bytes"):
-        p = tmp_path / "bytes"
-        p.write_bytes(text.encode("utf-8"))
-        with p.open("rb") as fp:
+                assert (
+                    list(reader(fp, textrgx, retain=retain, chunk_size=chunk_size))
+                    == splitvals
+                )
+        with subtests.test("read-bytes", chunk_size=chunk_size):
+            bfp = BytesIO(text.encode("utf-8"))
             with pytest.deprecated_call():
-                assert list(reader(fp, bytesrgx, retain=retain)) == splitbytes
+                assert (
+                    list(reader(bfp, bytesrgx, retain=retain, chunk_size=chunk_size))
+                    == splitbytes
+                )
+
+
+@pytest.mark.parametrize(
+    "pattern,literal",
+    [
+        (re.compile("XX?Y"), "X"),
+        (re.compile("abc+d"), "abc"),
+        (re.compile(rb"XY\d"), b"XY"),
+        (re.compile("a|b"), None),
+        (re.compile("(a)"), None),
+        (re.compile(r"\n"), None),
+        (re.compile("ab", re.IGNORECASE), None),
+        (re.compile("(?i)ab"), None),
+    ],
+)
+def test_required_literal(
+    pattern: re.Pattern[AnyStr], literal: Optional[AnyStr]
+) -> None:
+    assert _required_literal(pattern) == literal
+
+
+@pytest.mark.parametrize("reader", [read_preceded, read_separated, read_terminated])
+@pytest.mark.parametrize(
+    "make_fp,sep",
+    [
+        (lambda: BytesIO(b"foo\nbar\n"), "\n"),
+        (lambda: BytesIO(b""), "\n"),
+        (lambda: StringIO("foo\nbar\n"), b"\n"),
+        (lambda: StringIO(""), b"\n"),
+    ],
+)
+def test_read_type_mismatch(
+    reader: Reader, make_fp: Callable[[], IO[AnyStr]], sep: AnyStr
+) -> None:
+    with pytest.raises(TypeError):
+        list(reader(make_fp(), sep))
+
+
+class SubStr(str):
+    pass
+
+
+class SubBytes(bytes):
+    pass
+
+
+@pytest.mark.parametrize("reader", [read_preceded, read_separated, read_terminated])
+def test_read_subclassed_sep(subtests: SubTests, reader: Reader) -> None:
+    with subtests.test("str"):
+        assert list(reader(StringIO("a\nb\n"), SubStr("\n"))) == list(
+            reader(StringIO("a\nb\n"), "\n")
+        )
+    with subtests.test("bytes"):
+        assert list(reader(BytesIO(b"a\nb\n"), SubBytes(b"\n"))) == list(
+            reader(BytesIO(b"a\nb\n"), b"\n")
+        )
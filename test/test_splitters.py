@@ -1,13 +1,16 @@
 from __future__ import annotations
 from collections.abc import AsyncIterator
+import copy
 import sys
 from typing import Optional, TypeVar
+import weakref
 import pytest
 from pytest_subtests import SubTests
 from linesep import (
     ParagraphSplitter,
     PrecededSplitter,
     SeparatedSplitter,
+    Splitter,
     SplitterClosedError,
     SplitterEmptyError,
     TerminatedSplitter,
@@ -81,6 +84,20 @@ def encode_list(txt: list[str]) -> list[bytes]:
         ),
         ("\0", False, ["\0abc", "def\0ghi"], [[""], ["abcdef"]], ["ghi"]),
         ("\0", True, ["\0abc", "def\0ghi"], [["\0"], ["abcdef\0"]], ["ghi"]),
+        (
+            "\0",
+            False,
+            ["foo", "bar", "baz\0quux"],
+            [[], [], ["foobarbaz"]],
+            ["quux"],
+        ),
+        (
+            "\0",
+            True,
+            ["foo", "bar", "baz\0quux"],
+            [[], [], ["foobarbaz\0"]],
+            ["quux"],
+        ),
         (
             "</>",
             False,
@@ -95,6 +112,13 @@ def encode_list(txt: list[str]) -> list[bytes]:
             [["abc</>"], ["def</>"], ["ghi</>"], ["jkl<</>"]],
             ["mnop"],
         ),
+        (
+            "</>",
+            False,
+            ["ab", "c<", "/", ">d", "e"],
+            [[], [], [], ["abc"], []],
+            ["de"],
+        ),
     ],
 )
 def test_terminated_splitter(
@@ -344,6 +368,39 @@ def test_feed_get() -> None:
     assert not splitter.nonempty
 
 
+def test_feed_many() -> None:
+    splitter = TerminatedSplitter("\0", retain=True)
+    splitter.feed_many([])
+    assert not splitter.nonempty
+    splitter.feed_many(["foo\0b", "ar", "\0baz"])
+    assert splitter.getall() == ["foo\0", "bar\0"]
+    splitter.feed_many([])
+    assert not splitter.nonempty
+    splitter.feed_many(["\0", "quux"])
+    assert splitter.split("", final=True) == ["baz\0", "quux"]
+    with pytest.raises(SplitterClosedError) as excinfo:
+        splitter.feed_many(["extra"])
+    assert str(excinfo.value) == "Cannot feed data to closed splitter"
+
+
+def test_feed_many_universal_newlines() -> None:
+    splitter: UniversalNewlineSplitter[str] = UniversalNewlineSplitter(retain=True)
+    splitter.feed_many(["foo\r", "\nbar\r"])
+    assert splitter.getall() == ["foo\n"]
+    splitter.close()
+    assert splitter.getall() == ["bar\n"]
+
+
+def test_feed_get_many() -> None:
+    splitter = TerminatedSplitter("\0")
+    splitter.feed("x\0" * 3000)
+    for _ in range(1500):
+        assert splitter.get() == "x"
+    splitter.feed("y\0")
+    assert splitter.getall() == ["x"] * 1500 + ["y"]
+    assert not splitter.nonempty
+
+
 def test_split_final() -> None:
     splitter = TerminatedSplitter("\0")
     assert splitter.split("\0abc\0def\0gh") == ["", "abc", "def"]
@@ -378,6 +435,7 @@ def test_split_final() -> None:
         (False, False, ["foo\r\n\nbar"], [["foo", ""]], ["bar"]),
         (False, False, ["foo\r\n\r\nbar"], [["foo", ""]], ["bar"]),
         (False, False, ["foo\r\n\rbar"], [["foo", ""]], ["bar"]),
+        (False, False, ["foo", "bar", "baz\nquux"], [[], [], ["foobarbaz"]], ["quux"]),
         (False, False, ["foo\r\vbar"], [["foo"]], ["\vbar"]),
         (False, False, ["foo\v\fbar"], [[]], ["foo\v\fbar"]),
         (False, False, ["foo\f\x1Cbar"], [[]], ["foo\f\x1Cbar"]),
@@ -523,6 +581,75 @@ def test_getstate_setstate_get_some() -> None:
     assert splitter.getall() == []
 
 
+def test_universal_newline_splitter_releases_input() -> None:
+    class WeakStr(str):
+        # Instances of a `str` subclass (but not of `str`) can be weakly
+        # referenced
+        pass
+
+    data = WeakStr("foo\rbar\nbaz\rquux\n")
+    ref = weakref.ref(data)
+    splitter: UniversalNewlineSplitter[str] = UniversalNewlineSplitter()
+    splitter.feed(data)
+    assert splitter.getall() == ["foo", "bar", "baz", "quux"]
+    del data
+    assert ref() is None
+
+
+def test_universal_newline_splitter_reset_setstate() -> None:
+    splitter: UniversalNewlineSplitter[str] = UniversalNewlineSplitter()
+    splitter.feed("foo\rbar\nbaz")
+    st = splitter.getstate()
+    splitter.feed("\r")
+    splitter.reset()
+    assert splitter.split("quux\rglarch\n", final=True) == ["quux", "glarch"]
+    splitter.setstate(st)
+    assert splitter.split("\rcleesh\n", final=True) == ["foo", "bar", "baz", "cleesh"]
+
+
+@pytest.mark.parametrize(
+    "splitter,items",
+    [
+        (TerminatedSplitter("\n"), ["abc", "", "def"]),
+        (UniversalNewlineSplitter(), ["abc", "", "def"]),
+        (UnicodeNewlineSplitter(), ["abc", "", "def"]),
+        (ParagraphSplitter(), ["abc", "def"]),
+    ],
+)
+def test_feed_mixed_types(splitter: Splitter[str], items: list[str]) -> None:
+    splitter.feed("abc")
+    with pytest.raises(TypeError):
+        splitter.feed(b"x")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        splitter.feed_many(["d", b"x"])  # type: ignore[list-item]
+    splitter.feed("\n\ndef")
+    splitter.close()
+    assert splitter.getall() == items
+
+
+def test_setstate_fresh_splitter() -> None:
+    splitter = UniversalNewlineSplitter()
+    splitter.feed("abc")
+    splitter2 = UniversalNewlineSplitter()
+    splitter2.setstate(splitter.getstate())
+    splitter2.feed("def\nx")
+    splitter2.close()
+    assert splitter2.getall() == ["abcdef", "x"]
+
+
+def test_deepcopy() -> None:
+    splitter = UniversalNewlineSplitter()
+    splitter.feed("a\nb\r")
+    splitter2 = copy.deepcopy(splitter)
+    splitter2.feed("c\n\nd")
+    splitter2.close()
+    assert splitter2.getall() == ["a", "b", "c", "", "d"]
+    assert splitter.getall() == ["a"]
+    splitter.feed("e")
+    splitter.close()
+    assert splitter.getall() == ["b", "e"]
+
+
 def test_itersplit() -> None:
     splitter = TerminatedSplitter("\0")
     it = splitter.itersplit(["foo\0bar", "baz\0quux\0", "\0gnusto\0cleesh"])
@@ -575,6 +702,7 @@ async def test_aitersplit() -> None:
         (False, False, ["foo\u2028"], [["foo"]], []),
         (False, False, ["foo\u2029"], [["foo"]], []),
         (False, False, ["foo\r", "bar"], [[], ["foo"]], ["bar"]),
+        (False, False, ["foo", "bar", "baz\nquux"], [[], [], ["foobarbaz"]], ["quux"]),
         (False, False, ["foo\r", "\nbar"], [[], ["foo"]], ["bar"]),
         (False, False, ["foo\rbar"], [["foo"]], ["bar"]),
         (False, False, ["foo\r\nbar"], [["foo"]], ["bar"]),
@@ -839,3 +967,14 @@ def test_paragraph_splitter(
             assert bsplitter.split(x.encode("utf-8")) == encode_list(y)
         bsplitter.close()
         assert bsplitter.getall() == encode_list(endput)
+
+
+@pytest.mark.parametrize("retain", [False, True])
+def test_paragraph_splitter_many_paragraphs(retain: bool) -> None:
+    splitter: ParagraphSplitter[str] = ParagraphSplitter(retain=retain)
+    splitter.feed("\r\n\r\n".join(f"Para {i}\r\nline\rline" for i in range(1000)))
+    splitter.close()
+    sep = "\n\n" if retain else ""
+    assert splitter.getall() == [f"Para {i}\nline\nline{sep}" for i in range(999)] + [
+        "Para 999\nline\nline"
+    ]